@@ -33,6 +33,19 @@ logger = logging.getLogger(__name__)
 OLLAMA_API = os.getenv("OLLAMA_API_URL", "http://localhost:11434/api/chat")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
 OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT_S", "180"))
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "32"))
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=OLLAMA_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive pool: batch rows (processed concurrently) reuse connections instead of reconnecting per call.
+_HTTP = _build_http_session()
 
 # Helpers
 def _session_id():
@@ -66,7 +79,7 @@ def call_ollama_chat(system: str, user: str, model: str = OLLAMA_MODEL, max_toke
     while attempt <= retries:
         try:
             logger.info("Calling Ollama API at %s with model=%s (attempt %d)", OLLAMA_API, model, attempt + 1)
-            resp = requests.post(OLLAMA_API, json=payload, timeout=OLLAMA_TIMEOUT)
+            resp = _HTTP.post(OLLAMA_API, json=payload, timeout=OLLAMA_TIMEOUT)
             resp.raise_for_status()
             data = resp.json()
             content = data.get("message", {}).get("content", "")
@@ -261,12 +274,25 @@ def generate_fnol_ollama(sanitized_row: dict, rag_client=None):
             trimmed.append({**r, "text": txt[:limit]})
         return trimmed
 
+    def _split_buckets(split: Dict[str, Any]):
+        fraud = _trim_rules(split.get("fraud", [])[:5])
+        coverage = _trim_rules(split.get("coverage", [])[:5])
+        general = _trim_rules(split.get("general", [])[:3])
+        return fraud, coverage, general
+
+    # batch callers retrieve once per distinct query and attach the result to the row:
+    # a dict of split buckets when the rag client supports it, otherwise a flat rule list
+    precomputed_rules = sanitized_row.get("_precomputed_rag")
     try:
-        if rag_client and hasattr(rag_client, "retrieve_rules_for_fnol_split"):
+        if isinstance(precomputed_rules, dict):
+            fraud_rules, coverage_rules, general_rules = _split_buckets(precomputed_rules)
+            rule_chunks = fraud_rules + coverage_rules + general_rules
+        elif precomputed_rules is not None:
+            rule_chunks = _trim_rules(precomputed_rules)
+            fraud_rules, coverage_rules, general_rules = [], [], rule_chunks
+        elif rag_client and hasattr(rag_client, "retrieve_rules_for_fnol_split"):
             split = rag_client.retrieve_rules_for_fnol_split(fnol_obj, top_k=16)
-            fraud_rules = _trim_rules(split.get("fraud", [])[:5])
-            coverage_rules = _trim_rules(split.get("coverage", [])[:5])
-            general_rules = _trim_rules(split.get("general", [])[:3])
+            fraud_rules, coverage_rules, general_rules = _split_buckets(split)
             rule_chunks = fraud_rules + coverage_rules + general_rules
         else:
             rule_chunks = _trim_rules(retrieve_rules_for_fnol(fnol_obj, top_k=12))
@@ -1,7 +1,12 @@
 # agents/orchestrator_agent.py
+import copy
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
 
-from core.use_cases import process_row
+from core.use_cases import attach_batch_rules, process_row, row_key
 from rag.vectorstore import SimpleVectorStore
 
 # load a simple RAG store (in-memory)
@@ -9,11 +14,59 @@ vs = SimpleVectorStore()
 vs.load_sample_docs()
 logger = logging.getLogger(__name__)
 
-def orchestrate_batch(rows: list):
-    results = []
-    for r in rows:
-        logger.info("Orchestrating FNOL generation for row.")
-        out = process_row(r)
-        results.append(out)
+# Rows are network-bound on the LLM call, so threads overlap their latency.
+FNOL_WORKERS = int(os.getenv("FNOL_WORKERS", "8"))
+
+
+def _timed_process(r: Dict[str, Any]) -> Dict[str, Any]:
+    row_start = time.perf_counter_ns()
+    out = process_row(r)
+    out["_duration_s"] = (time.perf_counter_ns() - row_start) / 1e9
+    return out
+
+
+def orchestrate_batch(
+    rows: list,
+    progress_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Process sanitized rows concurrently; results are returned in input order.
+    Identical rows are processed once and the result is copied to each duplicate.
+    Each result carries its own processing time in `_duration_s`. progress_callback(idx, out) is
+    invoked from the calling thread as rows complete (completion order), so it may touch the UI.
+    """
+    if not rows:
+        return []
+    results: Dict[int, Dict[str, Any]] = {}
+    # first index of each distinct row -> indices of its duplicates
+    duplicates: Dict[int, List[int]] = {}
+    seen: Dict[str, int] = {}
+    for idx, r in enumerate(rows):
+        first = seen.setdefault(row_key(r), idx)
+        duplicates.setdefault(first, [])
+        if first != idx:
+            duplicates[first].append(idx)
+    workers = max(1, min(max_workers or FNOL_WORKERS, len(duplicates)))
+    logger.info(
+        "Orchestrating FNOL generation for %d rows (%d distinct) with %d workers.",
+        len(rows), len(duplicates), workers,
+    )
+    distinct = list(duplicates)
+    prepared = dict(zip(distinct, attach_batch_rules([rows[idx] for idx in distinct])))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(_timed_process, prepared[idx]): idx for idx in distinct}
+        for fut in as_completed(futures):
+            idx = futures[fut]
+            try:
+                out = fut.result()
+            except Exception as e:
+                # one failed row must not discard the rest of the batch
+                logger.exception("FNOL processing failed for row %d.", idx)
+                out = {"error": "row_failed", "reason": str(e), "session_id": "n/a"}
+            for dup_idx in [idx, *duplicates[idx]]:
+                results[dup_idx] = out if dup_idx == idx else copy.deepcopy(out)
+                if progress_callback:
+                    progress_callback(dup_idx, results[dup_idx])
     logger.info("Completed orchestration for %d rows.", len(results))
-    return results
+    return [results[idx] for idx in range(len(rows))]
@@ -1,17 +1,28 @@
 # streamlit_app/app.py
+import functools
+import html
 import io
 import json
 import logging
+import time
 import traceback
 from datetime import datetime, date
 
+import numpy as np
+import orjson
+import pandas as pd
 import streamlit as st
+from jinja2 import Environment
 
-from schemas.claims import default_claim_assessment
+try:
+    from fpdf import FPDF  # type: ignore
+except Exception:
+    FPDF = None
+
+from schemas.claims import default_claim_assessment_dict
 from streamlit_app.utils.excel_parser import parse_excel_to_df
-from streamlit_app.utils.pii_sanitizer import mask_pii_df
-from streamlit_app.utils.validator import assign_policy_tags
-from core.use_cases import process_row
+from streamlit_app.utils.sanitize import sanitize_and_tag
+from agents.orchestrator_agent import orchestrate_batch
 
 
 logging.basicConfig(
@@ -20,28 +31,147 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_PREVIEW_ROWS = 100
+_UI_FLUSH_S = 0.25
+_UI_FLUSH_ROWS = 10
+_FREE_TEXT_COLS = ("incident_time", "incident_description")
+
+# Compiled once at import; autoescape keeps model-provided values from injecting markup.
+_CARD_TMPL = Environment(autoescape=True).from_string(
+    """
+<div class="card-z">
+  <div style="display:flex;justify-content:space-between;align-items:center;">
+    <div><strong>Row {{ row }}</strong> · Ref {{ ref }}</div>
+    <div style="font-size:12px;color:#6b7280;">{{ duration }}</div>
+  </div>
+  <div style="margin-top:6px;">
+    <span class="pill" style="background:linear-gradient(135deg,#22c55e,#16a34a);">Elig: {{ eligibility }}</span>
+    <span class="pill" style="background:linear-gradient(135deg,#f97316,#fb7185);">Fraud: {{ fraud_risk }}</span>
+    <span class="pill" style="background:linear-gradient(135deg,#6366f1,#a855f7);">Severity: {{ severity }}</span>
+  </div>
+</div>
+"""
+)
+
+_SEV_COLOR = {
+    "high": "#dc2626",
+    "severe": "#dc2626",
+    "medium": "#ea580c",
+    "moderate": "#ea580c",
+    "low": "#ca8a04",
+}
+
+_SEV_HTML = "<span style='color:{c}; font-weight:600'>{t}</span>".format
+
+
+def _esc(val) -> str:
+    # for model-provided text interpolated into markdown rendered with unsafe_allow_html
+    return html.escape(str(val))
+
 
 def _json_default(o):
-    try:
-        import pandas as pd
-    except Exception:
-        pd = None
+    # orjson encodes datetime/date/numpy natively; only subclasses such as pd.Timestamp and exotic types land here
     if isinstance(o, (datetime, date)):
         return o.isoformat()
-    if pd and isinstance(o, pd.Timestamp):
-        return o.isoformat()
     return str(o)
 
 
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _to_json_bytes(obj) -> bytes:
+    # Deferred download callables: Streamlit only serializes when the button is clicked, not on every rerun.
+    return orjson.dumps(obj, option=_JSON_OPTS, default=_json_default)
+
+
+def _stringify_seq(val):
+    return [v if isinstance(v, str) else json.dumps(v, ensure_ascii=False, default=str) for v in val]
+
+
+def _stringify_scalar(val):
+    return [str(val)]
+
+
+# Keyed on exact type so the common cases skip the isinstance chain and the TypeError path.
+_STRINGIFY = {
+    str: _stringify_scalar,
+    bool: _stringify_scalar,
+    list: _stringify_seq,
+    tuple: _stringify_seq,
+}
+
+
 def _stringify_list(val):
     if not val:
         return ["None"]
-    if isinstance(val, (str, bool)):
-        return [str(val)]
-    try:
-        return [v if isinstance(v, str) else json.dumps(v, ensure_ascii=False) for v in val]
-    except TypeError:
-        return [str(val)]
+    return _STRINGIFY.get(type(val), _stringify_scalar)(val)
+
+
+# list fields joined once per result for display, so reruns re-render stored strings instead of re-encoding lists
+_JOINED_FIELDS = {
+    "followups": "required_followups",
+    "flags": "fraud_flags",
+    "coverage": "coverage_applicable",
+    "excluded": "excluded_reasons",
+}
+
+
+def _severity_display(results: list[dict]) -> tuple[list[str], list[str]]:
+    """Severity label + colored span for a batch of results in one vectorized pass."""
+    raw = [((r.get("claim_assessment") or {}).get("damage_summary") or {}).get("severity") for r in results]
+    sevs = pd.Series([v if isinstance(v, str) else "" for v in raw], dtype=object).str.casefold()
+    colors = sevs.map(_SEV_COLOR).fillna("inherit")
+    labels = sevs.str.title().replace("", "Unknown")
+    # the label comes from model output, so it is escaped before going into the span
+    return list(labels), [_SEV_HTML(c=c, t=_esc(t)) for c, t in zip(colors, labels)]
+
+
+def _to_columnar(results: list[dict]) -> dict:
+    """
+    Column-per-field view of what the results list and sections display, so reruns read flat arrays
+    instead of walking each nested result dict. The raw dicts stay under "results" for detail view / downloads;
+    display-only values (labels, markup, joined strings) live here so they never leak into the exported JSON.
+    """
+    sev_labels, sev_html = _severity_display(results)
+    refs, eligibility, fraud = [], [], []
+    joined: dict[str, list[str]] = {k: [] for k in _JOINED_FIELDS}
+    for out in results:
+        fnol = out.get("fnol_package") or {}
+        sid = fnol.get("session_id", "n/a")
+        # error rows carry no assessment; rendered rows fall back to the default one
+        ca = out.get("claim_assessment") or (default_claim_assessment_dict(sid) if fnol else {})
+        refs.append(str(ca.get("claim_reference_id", sid)))
+        eligibility.append(str(ca.get("eligibility", "n/a")))
+        fraud.append(str(ca.get("fraud_risk_level", "n/a")))
+        for key, field in _JOINED_FIELDS.items():
+            joined[key].append(", ".join(_stringify_list(ca.get(field))))
+    return {
+        "ref": np.array(refs, dtype=object),
+        "eligibility": pd.Categorical(eligibility),
+        "fraud_risk_level": pd.Categorical(fraud),
+        "severity": pd.Categorical(sev_labels),
+        "severity_html": np.array(sev_html, dtype=object),
+        **{key: np.array(vals, dtype=object) for key, vals in joined.items()},
+        "process_ready": np.fromiter((_is_process_ready(r) for r in results), dtype=bool, count=len(results)),
+        "results": results,
+    }
+
+
+def _render_preview(df, full_toggle_label: str | None = None):
+    # Large uploads would otherwise ship the whole frame to the browser on every rerun.
+    st.caption(f"{len(df):,} rows × {len(df.columns)} cols")
+    if full_toggle_label and len(df) > _PREVIEW_ROWS and st.toggle(full_toggle_label):
+        st.dataframe(df, width="stretch")
+    else:
+        st.dataframe(df.head(_PREVIEW_ROWS), width="stretch")
+
+
+def _precompute_derived(masked: pd.DataFrame) -> pd.DataFrame:
+    # Column-wise cleanup once per upload; otherwise empty Excel cells reach the LLM rows as NaN ("nan").
+    for col in _FREE_TEXT_COLS:
+        if col in masked.columns and not pd.api.types.is_datetime64_any_dtype(masked[col]):
+            masked[col] = masked[col].fillna("").astype(str).str.strip()
+    return masked
 
 
 def _go_to_detail(action: str, payload: dict, row_idx: int):
@@ -55,15 +185,20 @@ def _clear_nav_view():
     st.query_params.clear()
 
 
+@st.fragment
 def _render_nav_view():
+    # Runs as a fragment so "Back to results" reruns only this panel before the full-page refresh.
     nav = st.session_state.get("nav_view")
-    query = st.query_params
-    if not nav and query.get("view") == ["detail"]:
-        row_q = query.get("row", [None])[0]
+    if not nav:
+        # st.query_params values are plain strings (not lists as in experimental_get_query_params)
+        query = st.query_params
+        if query.get("view") != "detail":
+            return
+        row_q = query.get("row")
         if row_q is not None:
             try:
                 idx = int(row_q)
-                stored = st.session_state.get("fnol_results", [])
+                stored = (st.session_state.get("fnol_results") or {}).get("results", [])
                 if 0 <= idx < len(stored):
                     st.session_state["nav_view"] = {
                         "action": "process",
@@ -73,8 +208,8 @@ def _render_nav_view():
                     nav = st.session_state["nav_view"]
             except Exception:
                 pass
-    if not nav:
-        return
+        if not nav:
+            return
     action = nav.get("action", "Review")
     data = nav.get("payload", {})
     row_idx = nav.get("row_idx", 0)
@@ -89,7 +224,7 @@ def _render_nav_view():
     st.json(data, expanded=False)
     if st.button("Back to results", key="back-to-results"):
         _clear_nav_view()
-    st.stop()
+        st.rerun()
 
 def _is_process_ready(out: dict) -> bool:
     fnol_data = out.get("fnol_package") or {}
@@ -104,9 +239,7 @@ def _is_process_ready(out: dict) -> bool:
 
 
 def _build_pdf_bytes(rows: list[dict], title: str):
-    try:
-        from fpdf import FPDF  # type: ignore
-    except Exception:
+    if FPDF is None:
         return None, "PDF generation requires 'fpdf'. Install with: pip install fpdf"
 
     pdf = FPDF()
@@ -133,79 +266,89 @@ def _build_pdf_bytes(rows: list[dict], title: str):
     return buf.getvalue(), None
 
 
-def _render_section(rows: list[dict], title: str, action: str):
+def _render_section(cols: dict, positions, title: str, action: str):
+    results = cols["results"]
     st.subheader(title)
-    pdf_bytes, pdf_err = _build_pdf_bytes(rows, title)
+    pdf_bytes, pdf_err = _build_pdf_bytes([results[i] for i in positions], title)
     if pdf_bytes:
         st.download_button(f"Download {title} PDF", pdf_bytes, file_name=f"{title.replace(' ','_').lower()}.pdf")
     elif pdf_err:
         st.info(pdf_err)
-    for idx, out in enumerate(rows):
-        fnol = out.get("fnol_package") or {}
-        ca = out.get("claim_assessment") or {}
-        ref = ca.get("claim_reference_id", fnol.get("session_id", "n/a"))
+    for idx, pos in enumerate(positions):
+        ref = cols["ref"][pos]
         st.markdown(f"**Row {idx+1} — Ref {ref}**")
-        st.write(f"Eligibility: {ca.get('eligibility','n/a')}")
-        st.write(f"Fraud risk: {ca.get('fraud_risk_level','n/a')}")
-        st.write(f"Severity: {(ca.get('damage_summary') or {}).get('severity','n/a')}")
+        st.write(f"Eligibility: {cols['eligibility'][pos]}")
+        st.write(f"Fraud risk: {cols['fraud_risk_level'][pos]}")
+        st.write(f"Severity: {cols['severity'][pos]}")
         st.button(
             "Process Claim" if action == "process" else "Review Claim",
             key=f"section-{action}-{idx}-{ref}",
             on_click=_go_to_detail,
-            args=(action, out, idx),
+            args=(action, results[pos], idx),
         )
 
-def _render_rows(rows, results_container, existing=False, start_index: int = 0):
-    for idx, out in enumerate(rows):
+
+def _render_sections(cols: dict):
+    ready = cols["process_ready"]
+    if ready.any():
+        _render_section(cols, np.flatnonzero(ready), "Process-ready Claims", "process")
+    if not ready.all():
+        _render_section(cols, np.flatnonzero(~ready), "Review Claims", "review")
+
+def _render_rows(cols: dict, results_container, existing=False, row_indices=None):
+    # row_indices: each row's position in the full batch (live rows arrive out of order); defaults to 0..n-1
+    for idx, out in enumerate(cols["results"]):
+        row_idx = row_indices[idx] if row_indices is not None else idx
         with results_container:
             fnol_data = out.get("fnol_package") or {}
             if fnol_data:
                 sid = fnol_data.get("session_id", "n/a")
-                ca = out.get("claim_assessment") or default_claim_assessment(sid).to_dict()
-                claim_ref = ca.get("claim_reference_id", sid)
-                eligibility = ca.get("eligibility", "?")
-                fraud_risk = ca.get("fraud_risk_level", "?")
-                severity_val = (ca.get("damage_summary") or {}).get("severity", "")
-                severity = severity_val.lower() if isinstance(severity_val, str) else ""
-                color_map = {
-                    "high": "#dc2626",
-                    "severe": "#dc2626",
-                    "medium": "#ea580c",
-                    "moderate": "#ea580c",
-                    "low": "#ca8a04"
-                }
-                sev_color = color_map.get(severity, "inherit")
-                severity_text = f"<span style='color:{sev_color}; font-weight:600'>{severity.title() if severity else 'Unknown'}</span>"
-                row_number = start_index + idx + 1
+                ca = out.get("claim_assessment") or default_claim_assessment_dict(sid)
+                claim_ref = cols["ref"][idx]
+                eligibility = cols["eligibility"][idx]
+                fraud_risk = cols["fraud_risk_level"][idx]
+                severity_label = cols["severity"][idx]
+                severity_text = cols["severity_html"][idx]
+                row_number = row_idx + 1
                 duration = out.get("_duration_s")
                 duration_text = f" | {duration:.1f}s" if isinstance(duration, (int, float)) else ""
                 row_container = st.container()
                 with row_container:
                     st.markdown(
-                        f"""
-                        <div class="card-z">
-                          <div style="display:flex;justify-content:space-between;align-items:center;">
-                            <div><strong>Row {row_number}</strong> · Ref {claim_ref}</div>
-                            <div style="font-size:12px;color:#6b7280;">{duration_text or ''}</div>
-                          </div>
-                          <div style="margin-top:6px;">
-                            <span class="pill" style="background:linear-gradient(135deg,#22c55e,#16a34a);">Elig: {eligibility}</span>
-                            <span class="pill" style="background:linear-gradient(135deg,#f97316,#fb7185);">Fraud: {fraud_risk}</span>
-                            <span class="pill" style="background:linear-gradient(135deg,#6366f1,#a855f7);">Severity: {severity.title() if severity else 'Unknown'}</span>
-                          </div>
-                        </div>
-                        """,
+                        _CARD_TMPL.render(
+                            row=row_number,
+                            ref=claim_ref,
+                            duration=duration_text,
+                            eligibility=eligibility,
+                            fraud_risk=fraud_risk,
+                            severity=severity_label,
+                        ),
                         unsafe_allow_html=True,
                     )
                     with st.expander("Details", expanded=False):
-                        st.markdown(f"Severity: {severity_text}", unsafe_allow_html=True)
-                        st.write(f"Summary: {out.get('summary', '(no summary provided)')}")
-                        st.write(f"Eligibility reason: {ca.get('eligibility_reason', 'n/a')}")
-                        st.write(f"Fraud risk: {fraud_risk}")
+                        rec = ca.get("recommendation", {})
+                        # one markdown delta per block instead of a websocket round-trip per field;
+                        # the block allows HTML for the severity span, so every model-provided value is escaped
+                        st.markdown(
+                            "\n\n".join(
+                                [
+                                    f"Severity: {severity_text}",
+                                    f"Summary: {_esc(out.get('summary', '(no summary provided)'))}",
+                                    f"Eligibility reason: {_esc(ca.get('eligibility_reason', 'n/a'))}",
+                                    f"Fraud risk: {_esc(fraud_risk)}",
+                                    f"Required followups: {_esc(cols['followups'][idx])}",
+                                    f"Fraud flags: {_esc(cols['flags'][idx])}",
+                                    f"Coverage applicable: {_esc(cols['coverage'][idx])}",
+                                    f"Excluded reasons: {_esc(cols['excluded'][idx])}",
+                                    f"Recommendation: {_esc(rec.get('action', 'n/a'))} — {_esc(rec.get('notes_for_handler', ''))}",
+                                ]
+                            ),
+                            unsafe_allow_html=True,
+                        )
                         # Process when no human intervention is needed
-                        should_process = _is_process_ready(out)
+                        should_process = cols["process_ready"][idx]
                         btn_label = "Process Claim" if should_process else "Review Claim"
-                        btn_key = f"claim-action-{'prev' if existing else 'live'}-{start_index+idx}-{sid}"
+                        btn_key = f"claim-action-{'prev' if existing else 'live'}-{row_idx}-{sid}"
                         st.button(
                             btn_label,
                             key=btn_key,
@@ -213,32 +356,33 @@ def _render_rows(rows, results_container, existing=False, start_index: int = 0):
                             args=(
                                 "process" if should_process else "review",
                                 out,
-                                start_index + idx,
+                                row_idx,
                             ),
                         )
-                        st.write(f"Required followups: {', '.join(_stringify_list(ca.get('required_followups')))}")
-                        st.write(f"Fraud flags: {', '.join(_stringify_list(ca.get('fraud_flags')))}")
-                        st.write(f"Coverage applicable: {', '.join(_stringify_list(ca.get('coverage_applicable')))}")
-                        st.write(f"Excluded reasons: {', '.join(_stringify_list(ca.get('excluded_reasons')))}")
-                        st.write(f"Recommendation: {ca.get('recommendation', {}).get('action', 'n/a')} — {ca.get('recommendation', {}).get('notes_for_handler', '')}")
                         with st.expander("More details", expanded=False):
                             policy = fnol_data.get("policy") if isinstance(fnol_data.get("policy"), dict) else {}
                             policy_cov = policy.get("coverage_type") or fnol_data.get("policy_coverage_type") or "n/a"
                             policy_addons = policy.get("addons") if isinstance(policy, dict) else []
-                            st.write(f"Incident time: {fnol_data.get('incident_time', 'n/a')}")
-                            st.write(f"Incident location: {fnol_data.get('incident_location', 'n/a')}")
-                            st.write(f"Damage regions: {', '.join(fnol_data.get('damage_regions', []) or ['n/a'])}")
-                            st.write(f"Missing fields: {', '.join(fnol_data.get('missing_fields', []) or ['None'])}")
-                            st.write(f"Coverage indicator: {fnol_data.get('coverage_indicator', 'n/a')}")
-                            st.write(f"Policy coverage type: {policy_cov}")
-                            st.write(f"Policy addons: {', '.join(policy_addons or []) or 'n/a'}")
-                            st.write(f"Manual review: {fnol_data.get('requires_manual_review', False)}")
-                            st.write(f"Confidence: {out.get('confidence', 'n/a')}")
-                            st.write(f"Verification passed: {out.get('verification', {}).get('passed', 'n/a')}")
-                            st.write(f"Cited docs: {len(fnol_data.get('cited_docs', []) or [])}")
+                            st.markdown(
+                                "\n\n".join(
+                                    [
+                                        f"Incident time: {fnol_data.get('incident_time', 'n/a')}",
+                                        f"Incident location: {fnol_data.get('incident_location', 'n/a')}",
+                                        f"Damage regions: {', '.join(fnol_data.get('damage_regions', []) or ['n/a'])}",
+                                        f"Missing fields: {', '.join(fnol_data.get('missing_fields', []) or ['None'])}",
+                                        f"Coverage indicator: {fnol_data.get('coverage_indicator', 'n/a')}",
+                                        f"Policy coverage type: {policy_cov}",
+                                        f"Policy addons: {', '.join(policy_addons or []) or 'n/a'}",
+                                        f"Manual review: {fnol_data.get('requires_manual_review', False)}",
+                                        f"Confidence: {out.get('confidence', 'n/a')}",
+                                        f"Verification passed: {out.get('verification', {}).get('passed', 'n/a')}",
+                                        f"Cited docs: {len(fnol_data.get('cited_docs', []) or [])}",
+                                    ]
+                                )
+                            )
             else:
                 sid = out.get("session_id", "n/a")
-                row_number = idx + 1
+                row_number = row_idx + 1
                 label = f"Row {row_number} — error (session {sid})"
                 with st.expander(label, expanded=False):
                     st.warning(out.get("error", "Unknown error"))
@@ -248,6 +392,17 @@ def _render_rows(rows, results_container, existing=False, start_index: int = 0):
                     if isinstance(fallback, dict):
                         st.write("Fallback summary:", fallback.get("summary", "n/a"))
 
+
+@st.fragment
+def _render_results_list(cols: dict):
+    # Widgets here (PDF downloads, expanders) rerun only this fragment instead of re-parsing the upload.
+    if st.session_state.get("nav_view"):
+        # A claim button opened the detail view, which renders at the top of the full page.
+        st.rerun()
+    results_container = st.container()
+    _render_rows(cols, results_container, existing=True)
+    _render_sections(cols)
+
 st.set_page_config(page_title="FNOL Intake Assistant (POC)", layout="wide")
 st.markdown("", unsafe_allow_html=True)
 st.markdown("<span class='pill'>Gen Z ready</span>", unsafe_allow_html=True)
@@ -256,6 +411,8 @@ st.markdown(
     "Upload a synthetic Excel file (sample in /sample_data). We’ll mask PII, run validators, and generate FNOL + claim assessments per row."
 )
 _render_nav_view()
+if st.session_state.get("nav_view"):
+    st.stop()
 
 uploaded_file = st.file_uploader("Upload Excel (.xlsx)", type=["xlsx"])
 sample_button = st.button("Load sample data")
@@ -268,17 +425,21 @@ if sample_button:
 if uploaded_file:
     try:
         logger.info("Uploaded file received: %s", uploaded_file.name)
-        df = parse_excel_to_df(uploaded_file)
+        try:
+            df = parse_excel_to_df(uploaded_file)
+        except ValueError as e:
+            st.error(f"⚠️ {e}")
+            st.stop()
         logger.info("Excel parsed to dataframe with %d rows.", len(df))
         st.success("Excel parsed")
         st.subheader("Original (display only)")
-        st.dataframe(df)
+        _render_preview(df)
 
         st.subheader("Sanitized preview (tokens only)")
-        masked = mask_pii_df(df)
-        masked = assign_policy_tags(masked)
+        masked = sanitize_and_tag(df)
+        masked = _precompute_derived(masked)
         logger.info("PII masked; proceeding to preview and processing.")
-        st.dataframe(masked)
+        _render_preview(masked, full_toggle_label="Show full sanitized table")
 
         if st.button("Process FNOL (Ollama)"):
             logger.info("FNOL processing triggered via Ollama.")
@@ -287,45 +448,49 @@ if uploaded_file:
             progress = st.progress(0, text=f"Processed 0/{total}")
             status_box = st.empty()
             results_container = st.container()
-            results = []
 
-            for idx, r in enumerate(rows):
-                logger.info("Processing row %d for session build.", idx)
-                row_start = datetime.now()
-                status_box.info(f"Processing row {idx+1} of {total}...")
-                out = process_row(r)
-                row_duration = (datetime.now() - row_start).total_seconds()
-                out["_duration_s"] = row_duration
-                results.append(out)
+            done: list[int] = []
+            pending: list[tuple[int, dict]] = []
+            last_ui = {"t": time.monotonic()}
+
+            def _on_row_done(idx: int, out: dict):
+                # update UI incrementally; rows complete out of order when processed concurrently
+                done.append(idx)
+                pending.append((idx, out))
+                now = time.monotonic()
+                # throttle websocket deltas: flush at most every _UI_FLUSH_S unless a batch fills or we are done
+                if len(done) < total and len(pending) < _UI_FLUSH_ROWS and now - last_ui["t"] < _UI_FLUSH_S:
+                    return
+                _render_rows(
+                    _to_columnar([p_out for _, p_out in pending]),
+                    results_container,
+                    row_indices=[p_idx for p_idx, _ in pending],
+                )
+                pending.clear()
+                last_ui["t"] = now
+                status_box.info(f"Processed row {idx+1} ({len(done)} of {total} done)")
+                progress.progress(len(done) / total, text=f"Processing {len(done)}/{total}")
 
-                # update UI incrementally
-                _render_rows([out], results_container, start_index=idx)
-                progress.progress((idx + 1) / total, text=f"Processing {idx+1}/{total}")
+            results = orchestrate_batch(rows, progress_callback=_on_row_done)
 
             logger.info("FNOL processing complete; %d rows.", len(results))
-            st.session_state["fnol_results"] = results
+            cols = _to_columnar(results)
+            st.session_state["fnol_results"] = cols
             st.success("Processed via Ollama")
-            st.download_button("Download results JSON", json.dumps(results, indent=2, default=_json_default), file_name="fnol_results.json")
+            st.download_button(
+                "Download results JSON",
+                data=functools.partial(_to_json_bytes, results),
+                file_name="fnol_results.json",
+                mime="application/json",
+                on_click="ignore",
+            )
             # Render grouped sections
-            process_ready = [r for r in results if _is_process_ready(r)]
-            review_needed = [r for r in results if not _is_process_ready(r)]
-            if process_ready:
-                _render_section(process_ready, "Process-ready Claims", "process")
-            if review_needed:
-                _render_section(review_needed, "Review Claims", "review")
+            _render_sections(cols)
         else:
             # If results already present, render them so they persist across reruns
             if st.session_state.get("fnol_results"):
                 st.info("Showing previously processed results.")
-                rows = st.session_state["fnol_results"]
-                results_container = st.container()
-                _render_rows(rows, results_container, existing=True)
-                process_ready = [r for r in rows if _is_process_ready(r)]
-                review_needed = [r for r in rows if not _is_process_ready(r)]
-                if process_ready:
-                    _render_section(process_ready, "Process-ready Claims", "process")
-                if review_needed:
-                    _render_section(review_needed, "Review Claims", "review")
+                _render_results_list(st.session_state["fnol_results"])
     except Exception:
         logger.exception("Failed to process file via Streamlit app.")
         st.error("⚠️ Failed to process file. Full traceback below:")
@@ -1,7 +1,12 @@
-from typing import Dict, Any
+import logging
+from collections import defaultdict
+from typing import Dict, Any, List
 
 from adapters.llm_ollama import OllamaLLMClient
 from adapters.rag_adapter import RagAdapter
+from schemas.claims import FNOL, fnol_from_row
+
+logger = logging.getLogger(__name__)
 
 
 class ClaimProcessingService:
@@ -16,3 +21,41 @@ class ClaimProcessingService:
 
     def process_row(self, masked_row: Dict[str, Any]) -> Dict[str, Any]:
         return self.llm_client.generate_fnol(masked_row)
+
+    def attach_batch_rules(self, rows: List[Dict[str, Any]], top_k: int = 12) -> List[Dict[str, Any]]:
+        """
+        Retrieve KB rules once per distinct retrieval query in the batch and attach them to copies of
+        the rows as `_precomputed_rag`, so the LLM client can skip per-row retrieval.
+        Clients with `retrieve_rules_for_fnol_split` attach the fraud/coverage/general buckets (as a dict),
+        matching what per-row retrieval would use; others attach the flat rule list.
+        Rows whose group fails retrieval are returned unchanged and retrieve on their own.
+        """
+        split = getattr(self.rag_client, "retrieve_rules_for_fnol_split", None)
+        groups: Dict[tuple, List[int]] = defaultdict(list)
+        fnols: Dict[tuple, FNOL] = {}
+        for idx, r in enumerate(rows):
+            fnol = fnol_from_row(r, "")
+            # every FNOL field the retrieval query is built from
+            key = (
+                fnol.policy.coverage_type,
+                tuple(fnol.policy.addons),
+                fnol.incident.location,
+                fnol.incident.description,
+                fnol.documents.photos_count,
+            )
+            groups[key].append(idx)
+            fnols.setdefault(key, fnol)
+        out = list(rows)
+        for key, idxs in groups.items():
+            try:
+                if split is not None:
+                    rules = split(fnols[key], top_k=16)
+                else:
+                    rules = self.rag_client.retrieve_rules_for_fnol(fnols[key], top_k=top_k)
+            except Exception:
+                logger.exception("Batch RAG retrieval failed for a row group; rows will retrieve individually.")
+                continue
+            for i in idxs:
+                out[i] = {**rows[i], "_precomputed_rag": rules}
+        logger.info("Batch RAG retrieval: %d rows, %d distinct queries.", len(rows), len(groups))
+        return out
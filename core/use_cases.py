@@ -1,16 +1,50 @@
-from typing import Dict, Any
+import copy
+import hashlib
+import json
+import threading
+from typing import Dict, Any, List
 
 from core.services import ClaimProcessingService
 
 _service = ClaimProcessingService()
 
+# Successful outputs keyed by row content; failures are not cached so a restarted Ollama is retried.
+_RESULT_CACHE_MAX = 1024
+_result_cache: Dict[str, Dict[str, Any]] = {}
+_result_cache_lock = threading.Lock()
+
+
+def row_key(masked_row: Dict[str, Any]) -> str:
+    """
+    Stable content hash of a sanitized row. Underscore-prefixed keys carry per-run metadata
+    and are excluded so they do not defeat deduplication.
+    """
+    payload = {k: v for k, v in masked_row.items() if not str(k).startswith("_")}
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
 
 def process_row(masked_row: Dict[str, Any], llm_client=None) -> Dict[str, Any]:
     """
     Entry point for processing a sanitized row into FNOL + assessment.
-    By default uses the service with Ollama LLM + RAG adapters.
+    By default uses the service with Ollama LLM + RAG adapters; identical rows are served from cache.
     llm_client can be injected to support alternate providers in future.
     """
     if llm_client:
         return llm_client.generate_fnol(masked_row)
-    return _service.process_row(masked_row)
+    key = row_key(masked_row)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    out = _service.process_row(masked_row)
+    if "error" not in out:
+        with _result_cache_lock:
+            if len(_result_cache) >= _RESULT_CACHE_MAX:
+                _result_cache.pop(next(iter(_result_cache)))
+            _result_cache[key] = copy.deepcopy(out)
+    return out
+
+
+def attach_batch_rules(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Precompute RAG rules for a batch (one retrieval per distinct query); see ClaimProcessingService."""
+    return _service.attach_batch_rules(rows)
@@ -1,18 +1,17 @@
 # rag/embedder.py
-# placeholder embedder - for POC, we use a simple TF-IDF style vector (or random)
+# placeholder embedder - for POC, we use a simple hashed bag-of-words vector
 import logging
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 
 logger = logging.getLogger(__name__)
 
 class SimpleEmbedder:
     def __init__(self):
-        self.vectorizer = TfidfVectorizer()
+        # stateless: no vocabulary to fit, and rows come back L2-normalized
+        self.vectorizer = HashingVectorizer(n_features=2**18, alternate_sign=False, norm="l2")
 
     def fit(self, docs):
-        texts = [d["text"] for d in docs]
-        self.vectorizer.fit(texts)
-        logger.info("TF-IDF embedder fitted on %d docs.", len(texts))
+        logger.info("Hashing embedder needs no fit (%d docs).", len(docs))
 
     def embed(self, text):
         logger.debug("Embedding text snippet len=%d", len(text))
@@ -1,29 +1,47 @@
 # rag/vectorstore.py
 import logging
+from functools import lru_cache
 
 from rag.loaders.load_docs import load_sample_docs
 from rag.embedder import SimpleEmbedder
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _get_store():
+    """Embed the docs once per process; every SimpleVectorStore shares the result."""
+    docs = load_sample_docs()
+    embedder = SimpleEmbedder()
+    # hashed rows are already L2-normalized, so cosine similarity is a single sparse dot product per query
+    doc_embeddings = embedder.vectorizer.transform([d["text"] for d in docs])
+    return docs, embedder, doc_embeddings
+
+
+@lru_cache(maxsize=1024)
+def _embed_cached(text: str):
+    return _get_store()[1].embed(text)
+
+
 class SimpleVectorStore:
     def __init__(self):
-        self.docs = []
-        self.embedder = SimpleEmbedder()
-        self.doc_embeddings = None
+        self.docs, self.embedder, self.doc_embeddings = _get_store()
 
     def load_sample_docs(self):
-        self.docs = load_sample_docs()
-        self.embedder.fit(self.docs)
-        self.doc_embeddings = self.embedder.vectorizer.transform([d["text"] for d in self.docs])
+        self.docs, self.embedder, self.doc_embeddings = _get_store()
         logger.info("Loaded %d sample docs into vector store.", len(self.docs))
 
     def retrieve_docs(self, query: str, top_k=3):
-        qv = self.embedder.embed(query)
-        sims = cosine_similarity(qv, self.doc_embeddings).flatten()
-        idxs = np.argsort(-sims)[:top_k]
+        qv = _embed_cached(query)
+        sims = (self.doc_embeddings @ qv.T).toarray().ravel()
+        k = min(top_k, len(sims))
+        if k > 0:
+            # partial selection of the top k, then order just those k
+            part = np.argpartition(-sims, k - 1)[:k]
+            idxs = part[np.argsort(-sims[part])]
+        else:
+            idxs = []
         results = []
         for i in idxs:
             results.append({"id": self.docs[i]["id"], "text": self.docs[i]["text"], "score": float(sims[i])})
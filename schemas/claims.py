@@ -4,7 +4,8 @@ Dataclasses for FNOL and claim assessment aligned to knowledge_base/json/KB-FNOL
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 
@@ -21,7 +22,38 @@ def _safe_date_str(val) -> Optional[str]:
         return None
 
 
-@dataclass
+def _cache_field_names(cls):
+    """Record the dataclass field names once, so serializers skip fields() reflection per call."""
+    cls.__fields_tuple__ = tuple(f.name for f in fields(cls))
+    return cls
+
+
+_PRIMITIVE_ANNOTATIONS = frozenset(
+    {"str", "int", "float", "bool", "None", "Optional[str]", "Optional[int]", "Optional[float]", "Optional[bool]"}
+)
+
+
+def _gen_to_dict(cls):
+    """
+    Give a leaf dataclass a straight-line to_dict, compiled once at import: `return {"f": self.f, ...}`.
+    Only for classes whose fields are all primitives (annotations are strings under postponed evaluation),
+    since the values are returned as-is without copying.
+    """
+    for f in fields(cls):
+        if f.type not in _PRIMITIVE_ANNOTATIONS:
+            raise TypeError(f"{cls.__name__}.{f.name}: {f.type} is not a primitive field")
+    body = ", ".join(f"{n!r}: self.{n}" for n in cls.__fields_tuple__)
+    ns: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{body}}}\n", {}, ns)
+    to_dict = ns["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    cls.to_dict = to_dict
+    return cls
+
+
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class WorkshopInfo:
     id: Optional[str] = None
     name: Optional[str] = None
@@ -29,7 +61,8 @@ class WorkshopInfo:
     phone: Optional[str] = None
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class PolicyInfo:
     policy_id: Optional[str] = None
     status: str = "Unknown"
@@ -39,8 +72,21 @@ class PolicyInfo:
     start_date: Optional[str] = None
     end_date: Optional[str] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "policy_id": self.policy_id,
+            "status": self.status,
+            "coverage_type": self.coverage_type,
+            "addons": list(self.addons),
+            "usage": self.usage,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class VehicleInfo:
     vin: Optional[str] = None
     registration_number: Optional[str] = None
@@ -50,7 +96,9 @@ class VehicleInfo:
     odometer: Optional[float] = None
 
 
-@dataclass
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class IncidentInfo:
     date: Optional[str] = None
     time: Optional[str] = None
@@ -61,7 +109,9 @@ class IncidentInfo:
     third_party_involved: Optional[bool] = None
 
 
-@dataclass
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class DocumentInfo:
     police_report_present: bool = False
     dl_present: bool = False
@@ -70,14 +120,17 @@ class DocumentInfo:
     estimate_present: bool = False
 
 
-@dataclass
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class DetectedDamage:
     part_name: str
     damage_type: Optional[str] = None
     severity: str = "Minor"
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class CVResults:
     damaged_parts: List[DetectedDamage] = field(default_factory=list)
     license_plate_ocr: Optional[str] = None
@@ -86,8 +139,19 @@ class CVResults:
     consistency_with_incident: str = "unknown"
     preexisting_damage_signals: List[str] = field(default_factory=list)
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "damaged_parts": [d.to_dict() for d in self.damaged_parts],
+            "license_plate_ocr": self.license_plate_ocr,
+            "vin_ocr": self.vin_ocr,
+            "odometer_ocr": self.odometer_ocr,
+            "consistency_with_incident": self.consistency_with_incident,
+            "preexisting_damage_signals": list(self.preexisting_damage_signals),
+        }
+
+
+@_cache_field_names
+@dataclass(slots=True)
 class FNOL:
     source: str = "Other"
     workshop: WorkshopInfo = field(default_factory=WorkshopInfo)
@@ -98,36 +162,60 @@ class FNOL:
     cv_results: CVResults = field(default_factory=CVResults)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-
-
-@dataclass
+        # built field by field: asdict() deep-copies every value through reflection
+        return {
+            "source": self.source,
+            "workshop": self.workshop.to_dict(),
+            "policy": self.policy.to_dict(),
+            "vehicle": self.vehicle.to_dict(),
+            "incident": self.incident.to_dict(),
+            "documents": self.documents.to_dict(),
+            "cv_results": self.cv_results.to_dict(),
+        }
+
+
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class DamagePart:
     part_name: str
     severity: str = "Minor"
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class DamageSummary:
     main_impact_area: str = "Unknown"
     severity: str = "Minor"
     damaged_parts: List[DamagePart] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "main_impact_area": self.main_impact_area,
+            "severity": self.severity,
+            "damaged_parts": [p.to_dict() for p in self.damaged_parts],
+        }
+
 
-@dataclass
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class Recommendation:
     action: str = "Escalate_To_Human"
     notes_for_handler: str = ""
 
 
-@dataclass
+@_gen_to_dict
+@_cache_field_names
+@dataclass(slots=True)
 class AuditLogEntry:
     rule_id: str
     decision_effect: str
     note: str
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class ClaimAssessment:
     claim_reference_id: str
     eligibility: str = "Review"
@@ -142,46 +230,71 @@ class ClaimAssessment:
     audit_log: List[AuditLogEntry] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-
-
-def fnol_from_row(row: Dict[str, Any], session_id: str) -> FNOL:
-    photos = row.get("photos") or []
-    incident_time = row.get("incident_time") or ""
-    incident_date = None
-    incident_time_part = None
+        return {
+            "claim_reference_id": self.claim_reference_id,
+            "eligibility": self.eligibility,
+            "eligibility_reason": self.eligibility_reason,
+            "coverage_applicable": list(self.coverage_applicable),
+            "excluded_reasons": list(self.excluded_reasons),
+            "required_followups": list(self.required_followups),
+            "fraud_risk_level": self.fraud_risk_level,
+            "fraud_flags": list(self.fraud_flags),
+            "damage_summary": self.damage_summary.to_dict(),
+            "recommendation": self.recommendation.to_dict(),
+            "audit_log": [e.to_dict() for e in self.audit_log],
+        }
+
+
+@lru_cache(maxsize=1024)
+def _build_fnol(key: tuple) -> FNOL:
+    policy_id, registration, location, description, policy_cov, policy_addons, photos_count, incident_time = key
+    incident_date = incident_time_part = None
     if incident_time:
         # naive split: first date part, second time part
-        parts = str(incident_time).split()
+        parts = str(incident_time).split(None, 2)
         if parts:
             incident_date = _safe_date_str(parts[0])
         if len(parts) > 1:
             incident_time_part = _safe_date_str(parts[1])
-    policy_cov = row.get("policy_coverage_type") or row.get("coverage_type") or "Unknown"
-    policy_addons = row.get("policy_addons") or row.get("addons") or []
-    fnol = FNOL(
+    return FNOL(
         source="Other",
-        workshop=WorkshopInfo(email=None),
-        policy=PolicyInfo(
-            policy_id=row.get("policy_number") or None,
-            coverage_type=policy_cov,
-            addons=policy_addons if isinstance(policy_addons, list) else []
-        ),
-        vehicle=VehicleInfo(registration_number=row.get("car_number") or None),
+        workshop=WorkshopInfo(),
+        policy=PolicyInfo(policy_id=policy_id, coverage_type=policy_cov, addons=list(policy_addons)),
+        vehicle=VehicleInfo(registration_number=registration),
         incident=IncidentInfo(
             date=incident_date,
             time=incident_time_part,
-            location=row.get("incident_location") or None,
-            impact_point="Unknown",
-            type="Collision",
-            description=row.get("incident_description") or "",
-            third_party_involved=None
-        ),
-        documents=DocumentInfo(
-            photos_count=len(photos) if isinstance(photos, list) else 0
+            location=location,
+            description=description,
         ),
+        documents=DocumentInfo(photos_count=photos_count),
+    )
+
+
+def fnol_from_row(row: Dict[str, Any], session_id: str) -> FNOL:
+    """
+    Build the FNOL for a sanitized row. Rows with identical FNOL inputs share one cached instance,
+    so treat the result as read-only.
+    """
+    g = row.get
+    # every field the FNOL is built from, read once; this tuple is also the cache key
+    policy_addons = g("policy_addons") or g("addons") or []
+    photos = g("photos")
+    key = (
+        g("policy_number") or None,
+        g("car_number") or None,
+        g("incident_location") or None,
+        g("incident_description") or "",
+        g("policy_coverage_type") or g("coverage_type") or "Unknown",
+        tuple(policy_addons) if isinstance(policy_addons, (list, tuple)) else (),
+        len(photos) if isinstance(photos, list) else 0,
+        g("incident_time"),
     )
-    return fnol
+    try:
+        return _build_fnol(key)
+    except TypeError:
+        # unhashable cell values (e.g. lists in free-text columns) skip the cache
+        return _build_fnol.__wrapped__(key)
 
 
 def validate_claim_assessment_dict(data: Dict[str, Any]) -> List[str]:
@@ -207,3 +320,16 @@ def default_claim_assessment(session_id: str) -> ClaimAssessment:
             notes_for_handler="Model output missing required fields; manual review needed."
         )
     )
+
+
+@lru_cache(maxsize=1)
+def _default_assessment_template() -> Dict[str, Any]:
+    return default_claim_assessment("__TEMPLATE__").to_dict()
+
+
+def default_claim_assessment_dict(session_id: str) -> Dict[str, Any]:
+    """
+    Dict form of default_claim_assessment without rebuilding the dataclass per call.
+    Nested values are shared with the cached template, so treat the result as read-only.
+    """
+    return {**_default_assessment_template(), "claim_reference_id": session_id}
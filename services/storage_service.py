@@ -1,6 +1,9 @@
 # services/storage_service.py
 # POC local storage helper (no PII saved)
+import json
 import logging
+import os
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -9,7 +12,22 @@ BASE = Path("data")
 BASE.mkdir(exist_ok=True)
 
 def save_json(obj, fname):
+    # obj may be pre-encoded JSON (bytes or str) or a JSON-serializable object; written compact in one write
     p = BASE / fname
-    p.write_text(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        data = obj
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+    else:
+        data = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    # write beside the target and rename over it, so concurrent readers never see a truncated file;
+    # the temp name is per writer so two workers saving the same claim don't share it
+    tmp = BASE / f"{fname}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     logger.info("Saved JSON to %s", p)
     return str(p)
@@ -1,21 +1,46 @@
 # streamlit_app/utils/excel_parser.py
 import logging
-from io import BytesIO
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+try:
+    import python_calamine  # noqa: F401  # Rust XLSX reader, much faster than openpyxl on large sheets
+    _ENGINE, _ENGINE_KWARGS = "calamine", {}
+except ImportError:
+    # openpyxl's streaming reader, cached cell values only; pandas' defaults, spelled out so they stay pinned
+    _ENGINE, _ENGINE_KWARGS = "openpyxl", {"read_only": True, "data_only": True, "keep_links": False}
+
+_EXPECTED_COLS = ("claimant_name", "car_number", "policy_number", "incident_time", "incident_description", "incident_location")
+_EXPECTED_SET = frozenset(_EXPECTED_COLS)
+
+def _normalize_header(c) -> str:
+    return str(c).strip().lower().replace(" ", "_")
+
 def parse_excel_to_df(uploaded_file) -> pd.DataFrame:
     # uploaded_file is an UploadedFile from Streamlit
-    df = pd.read_excel(BytesIO(uploaded_file.read()), engine='openpyxl')
+    # hand the upload straight to the reader instead of copying its bytes into a second buffer
+    uploaded_file.seek(0)
+    # only materialize the columns we use; extra sheet columns are skipped while streaming rows
+    df = pd.read_excel(
+        uploaded_file,
+        engine=_ENGINE,
+        engine_kwargs=_ENGINE_KWARGS,
+        usecols=lambda c: _normalize_header(c) in _EXPECTED_SET,
+    )
+    if df.columns.empty:
+        # usecols dropped everything: without this the upload silently parses to an empty frame
+        raise ValueError(
+            "None of the expected columns were found in the sheet's header row. Expected: "
+            + ", ".join(_EXPECTED_COLS)
+        )
     # normalize column names
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
-    # ensure expected columns exist - fill missing with empty strings
-    expected = ["claimant_name","car_number","policy_number","incident_time","incident_description","incident_location"]
-    for c in expected:
-        if c not in df.columns:
-            df[c] = ""
-            logger.warning("Missing expected column '%s' in upload; defaulting to empty.", c)
+    df.columns = df.columns.astype(str).str.strip().str.lower().str.replace(" ", "_", regex=False)
+    present = set(df.columns)
+    for c in [c for c in _EXPECTED_COLS if c not in present]:
+        logger.warning("Missing expected column '%s' in upload; defaulting to empty.", c)
+    # one reindex orders the columns and fills missing ones with empty strings
+    df = df.reindex(columns=list(_EXPECTED_COLS), fill_value="")
     logger.info("Parsed Excel with normalized columns: %s", list(df.columns))
-    return df[expected]
+    return df
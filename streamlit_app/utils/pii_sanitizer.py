@@ -2,20 +2,44 @@
 import hashlib
 import logging
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+PII_COLUMNS = frozenset(("claimant_name", "car_number", "policy_number", "incident_location"))
+
 def _tokenize(val: str) -> str:
-    if pd.isna(val) or val is None or str(val).strip()=="":
+    # plain NaN compare instead of pd.isna: this runs once per PII cell
+    if val is None or (isinstance(val, float) and val != val):
+        return ""
+    s = str(val)
+    if not s.strip():
         return ""
-    h = hashlib.sha256(str(val).encode()).hexdigest()[:10].upper()
+    # 5-byte BLAKE2b gives the same 10 hex chars without hashing a full SHA-256 digest and truncating it
+    h = hashlib.blake2b(s.encode(), digest_size=5).hexdigest().upper()
     return f"TOK-{h}"
 
+def tokenize_series(values: pd.Series) -> pd.Series:
+    # Claimant names / policy numbers repeat across rows, so hash each distinct value once.
+    cache: dict[str, str] = {}
+    vals = values.to_numpy(dtype=object, copy=False)
+    out = np.empty(len(vals), dtype=object)
+    for i, v in enumerate(vals):
+        if v is None or v is pd.NA or v != v:  # v != v is the NaN/NaT check without a pandas call
+            out[i] = ""
+            continue
+        key = str(v)
+        tok = cache.get(key)
+        if tok is None:
+            tok = cache[key] = _tokenize(key)
+        out[i] = tok
+    return pd.Series(out, index=values.index, name=values.name)
+
 def mask_pii_df(df: pd.DataFrame) -> pd.DataFrame:
-    df2 = df.copy()
-    for col in ["claimant_name","car_number","policy_number","incident_location"]:
-        if col in df2.columns:
-            df2[col] = df2[col].apply(lambda v: _tokenize(v))
-            logger.info("Masked PII column: %s", col)
+    # shallow copy: PII columns are replaced wholesale, the rest share df's buffers (don't edit cells in place)
+    df2 = df.copy(deep=False)
+    for col in [c for c in df2.columns if c in PII_COLUMNS]:
+        df2[col] = tokenize_series(df2[col])
+        logger.info("Masked PII column: %s", col)
     return df2
@@ -0,0 +1,27 @@
+# streamlit_app/utils/sanitize.py
+import logging
+
+import pandas as pd
+
+from streamlit_app.utils.pii_sanitizer import PII_COLUMNS, tokenize_series
+from streamlit_app.utils.validator import policy_tags
+
+logger = logging.getLogger(__name__)
+
+def sanitize_and_tag(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    mask_pii_df + assign_policy_tags in one pass: each column is visited once and the output frame
+    is assembled from the column arrays, so untouched columns are shared instead of copied twice.
+    """
+    out_cols = {}
+    for col in df.columns:
+        if col in PII_COLUMNS:
+            out_cols[col] = tokenize_series(df[col])
+            logger.info("Masked PII column: %s", col)
+        else:
+            out_cols[col] = df[col]
+    # tagged from the masked policy column, exactly as assign_policy_tags sees it after mask_pii_df
+    policy = out_cols.get("policy_number", pd.Series("", index=df.index))
+    out_cols["policy_coverage_type"], out_cols["policy_addons"] = policy_tags(policy)
+    logger.info("Assigned policy tags to %d rows.", len(df))
+    return pd.DataFrame(out_cols, index=df.index, copy=False)
@@ -1,46 +1,114 @@
 # streamlit_app/utils/validator.py
+import hashlib
 import logging
-import random
-from datetime import datetime
+import re
+from datetime import date
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# YYYY-MM-DD with optional [ T]HH:MM[:SS[.ffffff]] and UTC offset; validation only, so no datetime is built
+_ISO_RE = re.compile(
+    r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+    r"(?:[ T](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?)?$"
+)
+
+def _is_blank(v) -> bool:
+    """Missing-value rule shared by validate_row and validate_df: None, NaN/NaT/NA and "" are blank."""
+    if v is None or isinstance(v, str):
+        return not v
+    return pd.api.types.is_scalar(v) and bool(pd.isna(v))
+
+
+def _time_parsable(t) -> bool:
+    # datetime cells (e.g. pd.Timestamp from the Excel reader) are parsed already
+    return isinstance(t, date) or _ISO_RE.match(str(t)) is not None
+
+
 def validate_row(row: dict):
     issues = []
-    # incident_time parse
-    try:
-        if row.get("incident_time"):
-            datetime.fromisoformat(str(row["incident_time"]))
-    except Exception:
+    # incident_time parse; a blank time is missing, not unparsable
+    t = row.get("incident_time")
+    if not _is_blank(t) and not _time_parsable(t):
         issues.append("incident_time_unparsable")
-        logger.warning("incident_time unparsable for row: %s", row.get("incident_time"))
+        logger.warning("incident_time unparsable for row: %s", t)
     # required fields
-    if not row.get("policy_number"):
+    if _is_blank(row.get("policy_number")):
         issues.append("missing_policy_number")
         logger.warning("policy_number missing.")
-    if not row.get("incident_description"):
+    if _is_blank(row.get("incident_description")):
         issues.append("missing_description")
         logger.warning("incident_description missing.")
     return issues
 
 
+_ROW_ISSUES = np.array(["incident_time_unparsable", "missing_policy_number", "missing_description"], dtype=object)
+
+
+def _blank_mask(df, col: str) -> np.ndarray:
+    # vectorized _is_blank
+    if col not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    return (df[col].isna() | df[col].eq("")).to_numpy(dtype=bool)
+
+
+def validate_df(df):
+    """
+    validate_row for a whole upload: one vectorized mask per check instead of a dict per row.
+    Returns the issue list for each row, in row order.
+    """
+    bad_time = np.zeros(len(df), dtype=bool)
+    # datetime64 columns hold only parsed values or NaT (blank), so only other dtypes need the shape check
+    if "incident_time" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["incident_time"]):
+        times = df["incident_time"]
+        bad_time = ~_blank_mask(df, "incident_time") & ~times.astype(str).str.match(_ISO_RE).to_numpy(dtype=bool)
+        # rare: datetime objects whose str() the regex rejects (e.g. nanoseconds) still count as parsed
+        vals = times.to_numpy(dtype=object)
+        for i in np.flatnonzero(bad_time):
+            bad_time[i] = not _time_parsable(vals[i])
+    masks = np.column_stack([bad_time, _blank_mask(df, "policy_number"), _blank_mask(df, "incident_description")])
+    counts = masks.sum(axis=0)
+    for label, count in zip(_ROW_ISSUES, counts):
+        if count:
+            logger.warning("%s on %d of %d rows.", label, count, len(df))
+    return [_ROW_ISSUES[m].tolist() for m in masks]
+
+
+# parallel arrays of the tag options, so a batch is tagged with one index array + two takes
+_POLICY_COVERAGE_OPTIONS = np.array(["TPL", "COMP", "COMP"], dtype=object)
+# tuples: the take hands the same objects to every row, so they must not be mutable
+_POLICY_ADDON_OPTIONS = np.empty(3, dtype=object)
+_POLICY_ADDON_OPTIONS[:] = [(), (), ("ZeroDep",)]
+
+
+def _policy_tag_index(policy: str) -> int:
+    return hashlib.blake2b(policy.encode(), digest_size=8).digest()[0] % len(_POLICY_COVERAGE_OPTIONS)
+
+
+def policy_tags(policy_numbers: pd.Series):
+    """
+    Return (coverage_types, addons) column values, one per row. The option is picked from a hash of the
+    policy number, so the same upload is tagged the same way on every rerun and identical rows stay identical
+    (otherwise the per-row result cache and in-batch dedupe key on a fresh random draw each time).
+    """
+    codes, uniques = pd.factorize(policy_numbers.fillna("").astype(str))
+    picks = np.fromiter((_policy_tag_index(u) for u in uniques), dtype=np.intp, count=len(uniques))
+    idx = picks[codes]
+    return _POLICY_COVERAGE_OPTIONS[idx], _POLICY_ADDON_OPTIONS[idx]
+
+
 def assign_policy_tags(df):
     """
-    Randomly tag policies to emulate KB-based coverage categories:
+    Pseudo-randomly tag policies (stable per policy number) to emulate KB-based coverage categories:
       - Thirdparty (TPL) with no add-ons
       - Comprehensive without add-ons
       - Comprehensive with ZeroDep add-on
     """
-    options = [
-        {"coverage_type": "TPL", "addons": []},
-        {"coverage_type": "COMP", "addons": []},
-        {"coverage_type": "COMP", "addons": ["ZeroDep"]},
-    ]
-    df2 = df.copy()
-    tags = []
-    for _ in range(len(df2)):
-        tags.append(random.choice(options))
-    df2["policy_coverage_type"] = [t["coverage_type"] for t in tags]
-    df2["policy_addons"] = [t["addons"] for t in tags]
-    logger.info("Assigned random policy tags to %d rows.", len(df2))
+    # shallow copy: only new columns are added, so existing columns are shared with df
+    df2 = df.copy(deep=False)
+    policy = df2["policy_number"] if "policy_number" in df2.columns else pd.Series("", index=df2.index)
+    df2["policy_coverage_type"], df2["policy_addons"] = policy_tags(policy)
+    logger.info("Assigned policy tags to %d rows.", len(df2))
     return df2
@@ -0,0 +1,145 @@
+from agents import orchestrator_agent
+
+
+def test_orchestrate_batch_reports_progress_in_order(monkeypatch):
+    monkeypatch.setattr(orchestrator_agent, "process_row", lambda r: {"summary": r["incident_description"]})
+    seen = []
+
+    results = orchestrator_agent.orchestrate_batch(
+        [{"incident_description": "a"}, {"incident_description": "b"}],
+        progress_callback=lambda idx, out: seen.append((idx, out["summary"])),
+        max_workers=1,
+    )
+
+    assert [r["summary"] for r in results] == ["a", "b"]
+    assert seen == [(0, "a"), (1, "b")]
+    assert all(isinstance(r["_duration_s"], float) for r in results)
+
+
+def test_orchestrate_batch_keeps_input_order_when_rows_finish_out_of_order(monkeypatch):
+    import time
+
+    def slow_first(r):
+        if r["incident_description"] == "a":
+            time.sleep(0.05)
+        return {"summary": r["incident_description"]}
+
+    monkeypatch.setattr(orchestrator_agent, "process_row", slow_first)
+    seen = []
+
+    results = orchestrator_agent.orchestrate_batch(
+        [{"incident_description": "a"}, {"incident_description": "b"}],
+        progress_callback=lambda idx, out: seen.append(idx),
+        max_workers=2,
+    )
+
+    assert [r["summary"] for r in results] == ["a", "b"]
+    assert seen == [1, 0]
+
+
+def test_orchestrate_batch_processes_duplicate_rows_once(monkeypatch):
+    calls = []
+
+    def fake_process(r):
+        calls.append(r["incident_description"])
+        return {"summary": r["incident_description"]}
+
+    monkeypatch.setattr(orchestrator_agent, "process_row", fake_process)
+    rows = [{"incident_description": "a"}, {"incident_description": "b"}, {"incident_description": "a"}]
+
+    results = orchestrator_agent.orchestrate_batch(rows, max_workers=2)
+
+    assert sorted(calls) == ["a", "b"]
+    assert [r["summary"] for r in results] == ["a", "b", "a"]
+    assert results[0] is not results[2]
+
+
+def test_orchestrate_batch_records_failed_row_and_keeps_the_rest(monkeypatch):
+    def flaky(r):
+        if r["incident_description"] == "bad":
+            raise RuntimeError("ollama down")
+        return {"summary": r["incident_description"]}
+
+    monkeypatch.setattr(orchestrator_agent, "process_row", flaky)
+    seen = []
+
+    results = orchestrator_agent.orchestrate_batch(
+        [{"incident_description": "a"}, {"incident_description": "bad"}, {"incident_description": "b"}],
+        progress_callback=lambda idx, out: seen.append(idx),
+        max_workers=2,
+    )
+
+    assert results[0]["summary"] == "a" and results[2]["summary"] == "b"
+    assert results[1]["error"] == "row_failed"
+    assert results[1]["reason"] == "ollama down"
+    assert sorted(seen) == [0, 1, 2]
+
+
+def test_process_row_serves_identical_rows_from_cache(monkeypatch):
+    from core import use_cases
+
+    calls = []
+
+    def fake_service_process(row):
+        calls.append(row)
+        return {"summary": "ok"}
+
+    monkeypatch.setattr(use_cases._service, "process_row", fake_service_process)
+    monkeypatch.setattr(use_cases, "_result_cache", {})
+    row = {"policy_number": "TOK-1", "incident_description": "rear bump"}
+
+    first = use_cases.process_row(row)
+    first["_duration_s"] = 1.0
+    second = use_cases.process_row(dict(row, _precomputed="ignored"))
+
+    assert len(calls) == 1
+    assert second == {"summary": "ok"}
+
+
+def test_attach_batch_rules_retrieves_once_per_distinct_query():
+    from core.services import ClaimProcessingService
+
+    class FakeRag:
+        def __init__(self):
+            self.queries = []
+
+        def retrieve_rules_for_fnol(self, fnol, top_k=12):
+            self.queries.append(fnol.incident.description)
+            return [{"id": fnol.incident.description, "text": "rule"}]
+
+    rag = FakeRag()
+    service = ClaimProcessingService(llm_client=object(), rag_client=rag)
+    rows = [
+        {"incident_description": "rear bump", "policy_number": "TOK-1"},
+        {"incident_description": "front hit"},
+        {"incident_description": "rear bump", "policy_number": "TOK-2"},
+    ]
+
+    out = service.attach_batch_rules(rows)
+
+    assert sorted(rag.queries) == ["front hit", "rear bump"]
+    assert [r["_precomputed_rag"][0]["id"] for r in out] == ["rear bump", "front hit", "rear bump"]
+    assert "_precomputed_rag" not in rows[0]
+
+
+def test_attach_batch_rules_keeps_split_buckets_when_client_supports_them():
+    from core.services import ClaimProcessingService
+
+    class SplitRag:
+        def __init__(self):
+            self.calls = 0
+
+        def retrieve_rules_for_fnol(self, fnol, top_k=12):
+            raise AssertionError("split-capable clients should use the split call")
+
+        def retrieve_rules_for_fnol_split(self, fnol, top_k=16):
+            self.calls += 1
+            return {"fraud": [{"id": "f"}], "coverage": [{"id": "c"}], "general": [{"id": "g"}]}
+
+    rag = SplitRag()
+    service = ClaimProcessingService(llm_client=object(), rag_client=rag)
+    out = service.attach_batch_rules([{"incident_description": "rear bump"}, {"incident_description": "rear bump"}])
+
+    assert rag.calls == 1
+    assert out[0]["_precomputed_rag"]["fraud"] == [{"id": "f"}]
+    assert out[1]["_precomputed_rag"]["coverage"] == [{"id": "c"}]
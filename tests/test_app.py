@@ -0,0 +1,54 @@
+from streamlit.testing.v1 import AppTest
+
+
+def _render_results_script():
+    import streamlit as st
+
+    import app
+
+    results = [
+        {
+            "fnol_package": {"session_id": "s1"},
+            "summary": st.session_state["summary"],
+            "claim_assessment": {
+                "claim_reference_id": "R1",
+                "eligibility": "Approved",
+                "fraud_risk_level": "Low",
+                "required_followups": ["photos"],
+                "damage_summary": {"severity": st.session_state.get("severity", "low")},
+            },
+        },
+        {"error": "row_failed", "session_id": "n/a"},
+    ]
+    app._render_results_list(app._to_columnar(results))
+    st.text(app._to_json_bytes(results).decode())
+
+
+def _run(summary: str) -> AppTest:
+    at = AppTest.from_function(_render_results_script, default_timeout=30)
+    at.session_state["summary"] = summary
+    return at.run()
+
+
+def test_rendering_results_keeps_display_fields_out_of_the_export():
+    at = _run("rear bump")
+    assert not at.exception
+    exported = at.text[-1].value
+    assert "rear bump" in exported
+    for display_only in ("_sev", "_followups_str", "_flags_str", "<span"):
+        assert display_only not in exported
+
+
+def test_details_block_escapes_markup_from_model_output():
+    payload = "<script>alert(1)</script><img src=x onerror=alert(2)>"
+    at = AppTest.from_function(_render_results_script, default_timeout=30)
+    at.session_state["summary"] = payload
+    at.session_state["severity"] = "<b onmouseover=alert(3)>"
+    at.run()
+    assert not at.exception
+    details = next(m.value for m in at.markdown if m.value.startswith("Severity:"))
+    assert "<script>" not in details and "<img" not in details
+    assert "&lt;B Onmouseover=Alert(3)&gt;" in details
+    assert "Summary: &lt;script&gt;alert(1)&lt;/script&gt;&lt;img src=x onerror=alert(2)&gt;" in details
+    # the severity span itself is still emitted as HTML
+    assert details.startswith("Severity: <span style=")
@@ -93,3 +93,50 @@ def test_generate_fnol_backfills_missing_assessment(monkeypatch):
     assert ca["claim_reference_id"]
     assert ca["fraud_risk_level"]
     assert ca["recommendation"]["action"]
+
+
+def test_generate_fnol_uses_precomputed_rules(monkeypatch):
+    sanitized_row = {
+        "policy_number": "POL123",
+        "incident_time": "2025-12-01 10:30:00",
+        "incident_description": "Front collision minor",
+        "_precomputed_rag": [{"id": "batch-rule", "text": "batched rule", "meta": {}, "score": 1.0}],
+    }
+
+    def fake_call(system, user_prompt, model=None, max_tokens=None):
+        assert "batched rule" in user_prompt
+        return json.dumps({"claim_assessment": {}, "summary": "ok", "confidence": 0.9}), {"provider": "fake"}
+
+    def fail_rules(fnol_obj, top_k=12):
+        raise AssertionError("per-row retrieval should be skipped")
+
+    monkeypatch.setattr(fnol_agent_ollama, "call_ollama_chat", fake_call)
+    monkeypatch.setattr(fnol_agent_ollama, "retrieve_rules_for_fnol", fail_rules)
+
+    result = fnol_agent_ollama.generate_fnol_ollama(sanitized_row)
+    assert [c["id"] for c in result["retrieved_docs"]] == ["batch-rule"]
+
+
+def test_generate_fnol_uses_precomputed_split_buckets(monkeypatch):
+    sanitized_row = {
+        "policy_number": "POL123",
+        "incident_description": "Front collision minor",
+        "_precomputed_rag": {
+            "fraud": [{"id": "fraud-rule", "text": "fraud text", "meta": {}}],
+            "coverage": [{"id": "cov-rule", "text": "coverage text", "meta": {}}],
+            "general": [{"id": "gen-rule", "text": "general text", "meta": {}}],
+        },
+    }
+
+    def fake_call(system, user_prompt, model=None, max_tokens=None):
+        assert "fraud text" in user_prompt and "coverage text" in user_prompt
+        return json.dumps({"claim_assessment": {}, "summary": "ok", "confidence": 0.9}), {"provider": "fake"}
+
+    def fail_rules(fnol_obj, top_k=12):
+        raise AssertionError("per-row retrieval should be skipped")
+
+    monkeypatch.setattr(fnol_agent_ollama, "call_ollama_chat", fake_call)
+    monkeypatch.setattr(fnol_agent_ollama, "retrieve_rules_for_fnol", fail_rules)
+
+    result = fnol_agent_ollama.generate_fnol_ollama(sanitized_row)
+    assert [c["id"] for c in result["retrieved_docs"]] == ["fraud-rule", "cov-rule", "gen-rule"]
@@ -0,0 +1,50 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from streamlit_app.utils.excel_parser import parse_excel_to_df
+
+
+def _xlsx(df: pd.DataFrame) -> BytesIO:
+    buf = BytesIO()
+    df.to_excel(buf, index=False, engine="openpyxl")
+    buf.seek(0)
+    return buf
+
+
+def test_parse_excel_normalizes_headers_and_drops_extra_columns():
+    upload = _xlsx(
+        pd.DataFrame(
+            {
+                "Claimant Name": ["A"],
+                "Policy Number": ["POL1"],
+                "Incident Description": ["rear bump"],
+                "Internal Notes": ["not needed"],
+            }
+        )
+    )
+    df = parse_excel_to_df(upload)
+    assert list(df.columns) == [
+        "claimant_name",
+        "car_number",
+        "policy_number",
+        "incident_time",
+        "incident_description",
+        "incident_location",
+    ]
+    assert df.loc[0, "policy_number"] == "POL1"
+    assert df.loc[0, "car_number"] == ""
+
+
+def test_parse_excel_rewinds_an_already_read_upload():
+    upload = _xlsx(pd.DataFrame({"Policy Number": ["POL1"]}))
+    upload.read()
+    df = parse_excel_to_df(upload)
+    assert df.loc[0, "policy_number"] == "POL1"
+
+
+def test_parse_excel_rejects_sheet_without_expected_columns():
+    upload = _xlsx(pd.DataFrame({"Foo": [1, 2], "Bar": ["a", "b"]}))
+    with pytest.raises(ValueError, match="expected columns"):
+        parse_excel_to_df(upload)
@@ -0,0 +1,26 @@
+from rag.vectorstore import SimpleVectorStore
+
+
+def test_vector_stores_share_fitted_state():
+    a = SimpleVectorStore()
+    b = SimpleVectorStore()
+    b.load_sample_docs()
+    assert a.embedder is b.embedder
+    assert a.doc_embeddings is b.doc_embeddings
+
+
+def test_retrieve_docs_ranks_matching_doc_first():
+    store = SimpleVectorStore()
+    results = store.retrieve_docs("minimum photos license plate", top_k=2)
+    assert len(results) == 2
+    assert results[0]["id"] == "sop/photos"
+    assert results[0]["score"] >= results[1]["score"]
+
+
+def test_embeddings_are_stable_without_fit():
+    from rag.embedder import SimpleEmbedder
+
+    a = SimpleEmbedder().embed("rear bumper dent")
+    b = SimpleEmbedder().embed("rear bumper dent")
+    assert (a != b).nnz == 0
+    assert abs((a.multiply(a)).sum() - 1.0) < 1e-9
@@ -0,0 +1,70 @@
+import pandas as pd
+
+from streamlit_app.utils.pii_sanitizer import mask_pii_df
+from streamlit_app.utils.sanitize import sanitize_and_tag
+from streamlit_app.utils.validator import assign_policy_tags
+
+
+def _upload():
+    return pd.DataFrame(
+        [
+            {"claimant_name": "Jane Doe", "policy_number": "POL1", "incident_description": "rear bump"},
+            {"claimant_name": "Jane Doe", "policy_number": None, "incident_description": "front hit"},
+        ]
+    )
+
+
+def test_mask_pii_df_tokenizes_pii_and_keeps_other_columns():
+    masked = mask_pii_df(_upload())
+    assert masked.loc[0, "claimant_name"].startswith("TOK-")
+    assert len(masked.loc[0, "claimant_name"]) == len("TOK-") + 10
+    assert masked.loc[0, "claimant_name"] == masked.loc[1, "claimant_name"]
+    assert masked.loc[1, "policy_number"] == ""
+    assert list(masked["incident_description"]) == ["rear bump", "front hit"]
+
+
+def test_sanitize_and_tag_matches_mask_then_tag():
+    df = _upload()
+    out = sanitize_and_tag(df)
+    expected = assign_policy_tags(mask_pii_df(df))
+    for col in expected.columns:
+        assert list(out[col]) == list(expected[col])
+    assert set(out["policy_coverage_type"]) <= {"TPL", "COMP"}
+    assert all(isinstance(a, tuple) for a in out["policy_addons"])
+    assert df.loc[0, "claimant_name"] == "Jane Doe"
+
+
+def test_mask_pii_df_blanks_missing_values_and_reuses_tokens(monkeypatch):
+    from streamlit_app.utils import pii_sanitizer
+
+    calls = []
+    real = pii_sanitizer._tokenize
+    monkeypatch.setattr(pii_sanitizer, "_tokenize", lambda v: calls.append(v) or real(v))
+    df = pd.DataFrame({"car_number": ["CAR1", float("nan"), "CAR1", None, "  "]})
+    masked = mask_pii_df(df)
+    assert masked["car_number"].tolist()[1:] == ["", masked.loc[0, "car_number"], "", ""]
+    assert calls.count("CAR1") == 1
+
+
+def test_mask_pii_df_leaves_input_frame_untouched():
+    df = _upload()
+    mask_pii_df(df)
+    assert df.loc[0, "claimant_name"] == "Jane Doe"
+
+
+def test_sanitize_and_tag_gives_stable_row_keys_and_collapses_duplicates(monkeypatch):
+    from agents import orchestrator_agent
+    from core.use_cases import row_key
+
+    df = pd.DataFrame(
+        [{"policy_number": f"POL{i % 4}", "incident_description": f"desc {i % 4}"} for i in range(12)]
+    )
+    first = sanitize_and_tag(df).to_dict(orient="records")
+    second = sanitize_and_tag(df).to_dict(orient="records")
+    assert [row_key(r) for r in first] == [row_key(r) for r in second]
+
+    calls = []
+    monkeypatch.setattr(orchestrator_agent, "process_row", lambda r: calls.append(r) or {"summary": "ok"})
+    monkeypatch.setattr(orchestrator_agent, "attach_batch_rules", lambda rows: rows)
+    orchestrator_agent.orchestrate_batch(first, max_workers=2)
+    assert len(calls) == 4
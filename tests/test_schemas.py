@@ -1,6 +1,15 @@
+from dataclasses import asdict, replace
+
 from schemas.claims import (
+    AuditLogEntry,
+    ClaimAssessment,
+    CVResults,
+    DamagePart,
+    DamageSummary,
+    DetectedDamage,
     fnol_from_row,
     default_claim_assessment,
+    default_claim_assessment_dict,
     validate_claim_assessment_dict,
 )
 
@@ -38,3 +47,47 @@ def test_default_claim_assessment_and_validation():
     bad = {"claim_reference_id": "id-only"}
     errs_bad = validate_claim_assessment_dict(bad)
     assert "missing_eligibility" in errs_bad
+
+
+def test_default_claim_assessment_dict_matches_dataclass_shape():
+    assert default_claim_assessment_dict("sess-1") == default_claim_assessment("sess-1").to_dict()
+    assert default_claim_assessment_dict("sess-2")["claim_reference_id"] == "sess-2"
+
+
+def test_to_dict_matches_asdict_and_copies_lists():
+    fnol = replace(
+        fnol_from_row({"policy_number": "POL1", "policy_addons": ["ZeroDep"]}, "sess-1"),
+        cv_results=CVResults(damaged_parts=[DetectedDamage("bumper")], preexisting_damage_signals=["rust"]),
+    )
+    ca = ClaimAssessment(
+        claim_reference_id="sess-1",
+        fraud_flags=["late_report"],
+        damage_summary=DamageSummary(damaged_parts=[DamagePart("door", "Major")]),
+        audit_log=[AuditLogEntry("R1", "approve", "ok")],
+    )
+    for obj in (fnol, ca):
+        assert obj.to_dict() == asdict(obj)
+
+    data = fnol.to_dict()
+    data["policy"]["addons"].append("RSA")
+    assert fnol.policy.addons == ["ZeroDep"]
+
+
+def test_schema_dataclasses_use_slots():
+    fnol = fnol_from_row({"policy_number": "POL1"}, "sess-1")
+    assert not hasattr(fnol, "__dict__")
+    assert not hasattr(fnol.policy, "__dict__")
+
+
+def test_fnol_from_row_reuses_fnol_for_identical_rows():
+    row = {"policy_number": "POL1", "incident_time": "2025-12-01 10:30:00", "photos": ["a.jpg"]}
+    assert fnol_from_row(row, "sess-1") is fnol_from_row(dict(row), "sess-2")
+    assert fnol_from_row({**row, "photos": ["a.jpg", "b.jpg"]}, "sess-3").documents.photos_count == 2
+
+    unhashable = fnol_from_row({**row, "incident_location": ["not", "hashable"]}, "sess-4")
+    assert unhashable.incident.location == ["not", "hashable"]
+
+
+def test_fnol_from_row_accepts_tagged_addon_tuples():
+    fnol = fnol_from_row({"policy_number": "POL1", "policy_addons": ("ZeroDep",)}, "sess-1")
+    assert fnol.to_dict()["policy"]["addons"] == ["ZeroDep"]
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from services import storage_service
+
+
+def test_save_json_writes_each_payload_kind(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage_service, "BASE", tmp_path)
+
+    storage_service.save_json(b'{"a": 1}', "bytes.json")
+    storage_service.save_json('{"b": "é"}', "str.json")
+    path = storage_service.save_json({"c": [1, 2]}, "obj.json")
+
+    assert (tmp_path / "bytes.json").read_bytes() == b'{"a": 1}'
+    assert (tmp_path / "str.json").read_bytes() == '{"b": "é"}'.encode("utf-8")
+    assert (tmp_path / "obj.json").read_bytes() == b'{"c":[1,2]}'
+    assert json.loads((tmp_path / "obj.json").read_text()) == {"c": [1, 2]}
+    assert path == str(tmp_path / "obj.json")
+
+
+def test_save_json_replaces_target_and_leaves_no_temp_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage_service, "BASE", tmp_path)
+    (tmp_path / "claim.json").write_bytes(b'{"old": true}')
+
+    storage_service.save_json({"new": True}, "claim.json")
+
+    assert (tmp_path / "claim.json").read_bytes() == b'{"new":true}'
+    assert [p.name for p in tmp_path.iterdir()] == ["claim.json"]
+
+
+def test_save_json_removes_temp_file_when_replace_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage_service, "BASE", tmp_path)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage_service.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        storage_service.save_json({"a": 1}, "claim.json")
+    assert list(tmp_path.iterdir()) == []
@@ -1,7 +1,7 @@
 import pandas as pd
 
 from agents.validators import run_basic_checks
-from streamlit_app.utils.validator import assign_policy_tags
+from streamlit_app.utils.validator import assign_policy_tags, validate_df, validate_row
 
 
 def test_run_basic_checks_passes_valid_fnol():
@@ -82,3 +82,45 @@ def test_assign_policy_tags_adds_columns():
     assert "policy_coverage_type" in tagged.columns
     assert "policy_addons" in tagged.columns
     assert len(tagged["policy_coverage_type"].unique()) <= 3
+
+
+def test_validate_row_flags_unparsable_incident_time():
+    base = {"policy_number": "POL1", "incident_description": "desc"}
+    assert validate_row({**base, "incident_time": "2025-12-01 10:30:00"}) == []
+    for bad in ("yesterday", "2025-13-01", "01/12/2025"):
+        assert validate_row({**base, "incident_time": bad}) == ["incident_time_unparsable"]
+
+
+def test_validate_df_matches_validate_row():
+    df = pd.DataFrame(
+        [
+            {"policy_number": "POL1", "incident_description": "desc", "incident_time": "2025-12-01 10:30:00"},
+            {"policy_number": "", "incident_description": "desc", "incident_time": "yesterday"},
+            {"policy_number": "POL3", "incident_description": "", "incident_time": "2025-13-01"},
+            {"policy_number": "POL4", "incident_description": "desc", "incident_time": ""},
+            {"policy_number": float("nan"), "incident_description": None, "incident_time": float("nan")},
+            {"policy_number": "POL6", "incident_description": "desc", "incident_time": pd.NaT},
+            {"policy_number": "POL7", "incident_description": "desc", "incident_time": pd.Timestamp("2025-12-01 10:30")},
+        ]
+    )
+    expected = [
+        [],
+        ["incident_time_unparsable", "missing_policy_number"],
+        ["incident_time_unparsable", "missing_description"],
+        [],
+        ["missing_policy_number", "missing_description"],
+        [],
+        [],
+    ]
+    assert validate_df(df) == expected
+    assert [validate_row(r) for r in df.to_dict(orient="records")] == expected
+
+    # blank Excel cells in a datetime64 column arrive as NaT
+    times = pd.DataFrame(
+        {
+            "policy_number": ["POL1", "POL2"],
+            "incident_description": ["desc", "desc"],
+            "incident_time": pd.to_datetime(["2025-12-01 10:30", None]),
+        }
+    )
+    assert validate_df(times) == [validate_row(r) for r in times.to_dict(orient="records")] == [[], []]